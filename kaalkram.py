@@ -1,38 +1,160 @@
 import stanza
+import torch
 import json
 import re
-from typing import List, Dict, Any, Tuple, Optional
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple, Optional, Set, Callable
 from datetime import datetime, timedelta
 from dateutil import parser
 from dateutil.parser import ParserError
 from dateutil.relativedelta import relativedelta
 
+try:
+    import hyperscan
+except ImportError:  # Optional; without it every extractor runs on every point
+    hyperscan = None
+
+try:
+    import orjson
+except ImportError:  # Optional; JSON output falls back to the json module
+    orjson = None
+
+# Patterns used by preprocessing and splitting, compiled once at import
+_WS_RE = re.compile(r'\s+')
+# A compiled character-class sub measured faster here than str.translate or a
+# str.join filter, both of which step through the text in Python per character
+_NON_HINDI_RE = re.compile(r'[^\u0900-\u097F\s.,!?:0-9]')
+# Points end at a newline or after a danda (the danda is kept)
+_POINT_SPLIT_RE = re.compile(r'(?<=।)|\n')
+# Any Devanagari letter or sign, i.e. not a danda or a digit
+_DEVANAGARI_LETTER_RE = re.compile(r'[\u0900-\u0963\u0971-\u097F]')
+
+# Hindi month and weekday names, shared by the date, range and recurring patterns
+_MONTH_ALT = '(?:जनवरी|फरवरी|मार्च|अप्रैल|मई|जून|जुलाई|अगस्त|सितंबर|अक्टूबर|नवंबर|दिसंबर)'
+_SHORT_MONTH_ALT = '(?:जन|फर|मार्च|अप्रै|मई|जून|जुला|अग|सित|अक्टू|नवं|दिस)'
+_WEEKDAY_ALT = '(?:सोमवार|मंगलवार|बुधवार|गुरुवार|शुक्रवार|शनिवार|रविवार)'
+
+# Anchors for each family of date expressions. A single Hyperscan scan over a
+# point tells us which extractors can possibly match, so the rest are skipped.
+# Every month format has whitespace and a digit after the month, and the year
+# format a digit before 'में'; requiring them keeps common words from matching.
+_ANCHOR_PATTERNS = {
+    'month': rf'(?:{_MONTH_ALT}|{_SHORT_MONTH_ALT})\s+\d',
+    'numeric': r'\d[/-]\d',
+    'year': r'\d\s+में',
+    'recurring': r'हर',
+    'relative': r'आज|कल|परसों|हफ्ते|महीने|साल|सुबह|दोपहर|शाम|रात',
+}
+_ANCHOR_CATEGORIES = tuple(_ANCHOR_PATTERNS)
+_ALL_ANCHORS = frozenset(_ANCHOR_CATEGORIES)
+_DATE_ANCHORS = frozenset(('month', 'numeric', 'year', 'relative'))
+
+def _compile_anchor_database():
+    """
+    Compile the anchors into a Hyperscan database, or None when Hyperscan is
+    not installed or cannot run here (e.g. an unsupported CPU).
+    """
+    if hyperscan is None:
+        return None
+    flags = hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[pattern.encode('utf-8') for pattern in _ANCHOR_PATTERNS.values()],
+            ids=list(range(len(_ANCHOR_CATEGORIES))),
+            elements=len(_ANCHOR_CATEGORIES),
+            flags=[flags] * len(_ANCHOR_CATEGORIES),
+        )
+        # Scratch is allocated per thread later; check now that allocation works
+        hyperscan.Scratch(database)
+    except hyperscan.error:
+        return None
+    return database
+
+_ANCHOR_DATABASE = _compile_anchor_database()
+# A Hyperscan scratch can serve only one scan at a time, so each thread gets its own
+_ANCHOR_SCRATCH = threading.local()
+
+def _anchor_scratch():
+    """Return the calling thread's Hyperscan scratch for the anchor database."""
+    scratch = getattr(_ANCHOR_SCRATCH, 'scratch', None)
+    if scratch is None:
+        scratch = _ANCHOR_SCRATCH.scratch = hyperscan.Scratch(_ANCHOR_DATABASE)
+    return scratch
+
+_ONE_DAY = timedelta(days=1)
+_TWO_DAYS = timedelta(days=2)
+
+# Number of distinct texts whose Stanza tokens are kept per pipeline
+_TOKEN_CACHE_SIZE = 4096
+
+# Number of distinct points whose date extraction results are kept per processor
+_EXTRACT_CACHE_SIZE = 2048
+
+# Number of texts sent to Stanza per bulk_process call
+_BULK_BATCH_SIZE = 256
+
+# Stanza processors with and without dependency parsing
+_FULL_PROCESSORS = 'tokenize,pos,lemma,depparse'
+_LITE_PROCESSORS = 'tokenize,pos,lemma'
+
+@lru_cache(maxsize=4)
+def _load_pipeline(lang: str, processors: str, use_gpu: bool, device: str) -> stanza.Pipeline:
+    """
+    Build a Stanza pipeline. Pipelines are shared by every processor with the
+    same settings, so the models are only loaded once per process.
+    """
+    try:
+        return stanza.Pipeline(lang, processors=processors, use_gpu=use_gpu, device=device)
+    except FileNotFoundError as e:
+        # Raised when the resources file or the models have not been downloaded
+        print(f"Error initializing Stanza pipeline: {e}")
+        print(f"Downloading {lang} model...")
+        stanza.download(lang)
+        return stanza.Pipeline(lang, processors=processors, use_gpu=use_gpu, device=device)
+
+def _dumps(obj: Any) -> str:
+    """Serialize to indented JSON, keeping Hindi text unescaped."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
 class HindiTextProcessor:
-    def __init__(self):
-        """Initialize the Hindi text processor with Stanza pipeline."""
-        try:
-            self.nlp = stanza.Pipeline('hi', processors='tokenize,pos,lemma,depparse')
-        except Exception as e:
-            print(f"Error initializing Stanza pipeline: {e}")
-            print("Downloading Hindi model...")
-            stanza.download('hi')
-            self.nlp = stanza.Pipeline('hi', processors='tokenize,pos,lemma,depparse')
+    def __init__(self, need_deps: bool = True, device: str = "auto"):
+        """
+        Initialize the Hindi text processor with Stanza pipeline.
         
-        # Common Hindi date patterns
-        self.date_patterns = [
+        Args:
+            need_deps (bool): Whether tokens include dependency heads and relations
+                by default. Without them the dependency parser is never loaded.
+            device (str): Torch device for the Stanza models, e.g. "cpu" or "cuda:0".
+                "auto" uses CUDA when a GPU is available.
+        """
+        if device == "auto":
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.device = device
+        self.need_deps = need_deps
+        # Tokens of recently analysed texts per pipeline, least recently used first
+        self._token_caches: Dict[bool, OrderedDict] = {True: OrderedDict(), False: OrderedDict()}
+        # Date extraction results per point text, independent of the current time
+        self._match_all = lru_cache(maxsize=_EXTRACT_CACHE_SIZE)(self._match_all)
+        
+        # Common Hindi date formats, in priority order. Day-of-week mentions are
+        # not specific dates and are skipped.
+        self.date_formats = [(kind, re.compile(p)) for kind, p in (
             # Full date with Hindi month and year
-            r'(\d{1,2})\s+(जनवरी|फरवरी|मार्च|अप्रैल|मई|जून|जुलाई|अगस्त|सितंबर|अक्टूबर|नवंबर|दिसंबर)\s+(\d{4})',
+            ('dmy', rf'(?P<dmy_day>\d{{1,2}})\s+(?P<dmy_month>{_MONTH_ALT})\s+(?P<dmy_year>\d{{4}})'),
             # Full date with Hindi month (short form) and year
-            r'(\d{1,2})\s+(जन|फर|मार्च|अप्रै|मई|जून|जुला|अग|सित|अक्टू|नवं|दिस)\s+(\d{4})',
+            ('dmy_short', rf'(?P<dmy_short_day>\d{{1,2}})\s+(?P<dmy_short_month>{_SHORT_MONTH_ALT})\s+(?P<dmy_short_year>\d{{4}})'),
             # Numeric formats
-            r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})',
+            ('numeric', r'(?P<num_day>\d{1,2})[/-](?P<num_month>\d{1,2})[/-](?P<num_year>\d{4})'),
             # Year only
-            r'(\d{4})\s+में',
+            ('year', r'(?P<year_year>\d{4})\s+में'),
             # Month and year
-            r'(जनवरी|फरवरी|मार्च|अप्रैल|मई|जून|जुलाई|अगस्त|सितंबर|अक्टूबर|नवंबर|दिसंबर)\s+(\d{4})',
-            # Day of week
-            r'(सोमवार|मंगलवार|बुधवार|गुरुवार|शुक्रवार|शनिवार|रविवार)'
-        ]
+            ('my', rf'(?P<my_month>{_MONTH_ALT})\s+(?P<my_year>\d{{4}})'),
+        )]
         
         # Hindi month mapping (full and short forms)
         self.hindi_months = {
@@ -50,49 +172,72 @@ class HindiTextProcessor:
             'दिसंबर': '12', 'दिस': '12'
         }
 
-        # Relative date patterns
-        self.relative_date_patterns = {
+        # Relative date patterns, in priority order. Each function maps the
+        # current time to the date the phrase refers to.
+        relative_dates = [
             # Today and yesterday
-            r'आज': lambda: datetime.now(),
-            r'कल': lambda: datetime.now() - timedelta(days=1),
-            r'परसों': lambda: datetime.now() - timedelta(days=2),
-            r'आज रात': lambda: datetime.now().replace(hour=20, minute=0, second=0),
-            r'कल सुबह': lambda: (datetime.now() - timedelta(days=1)).replace(hour=8, minute=0, second=0),
+            (r'आज', lambda now: now),
+            (r'कल', lambda now: now - _ONE_DAY),
+            (r'परसों', lambda now: now - _TWO_DAYS),
+            (r'आज रात', lambda now: now.replace(hour=20, minute=0, second=0)),
+            (r'कल सुबह', lambda now: (now - _ONE_DAY).replace(hour=8, minute=0, second=0)),
             
             # This week
-            r'इस हफ्ते': lambda: datetime.now() - timedelta(days=datetime.now().weekday()),
-            r'पिछले हफ्ते': lambda: datetime.now() - timedelta(days=datetime.now().weekday() + 7),
-            r'अगले हफ्ते': lambda: datetime.now() - timedelta(days=datetime.now().weekday() - 7),
+            (r'इस हफ्ते', lambda now: now - timedelta(days=now.weekday())),
+            (r'पिछले हफ्ते', lambda now: now - timedelta(days=now.weekday() + 7)),
+            (r'अगले हफ्ते', lambda now: now - timedelta(days=now.weekday() - 7)),
             
             # This month
-            r'इस महीने': lambda: datetime.now().replace(day=1),
-            r'पिछले महीने': lambda: (datetime.now().replace(day=1) - relativedelta(months=1)),
-            r'अगले महीने': lambda: (datetime.now().replace(day=1) + relativedelta(months=1)),
+            (r'इस महीने', lambda now: now.replace(day=1)),
+            (r'पिछले महीने', lambda now: (now.replace(day=1) - relativedelta(months=1))),
+            (r'अगले महीने', lambda now: (now.replace(day=1) + relativedelta(months=1))),
             
             # This year
-            r'इस साल': lambda: datetime.now().replace(month=1, day=1),
-            r'पिछले साल': lambda: datetime.now().replace(month=1, day=1) - relativedelta(years=1),
-            r'अगले साल': lambda: datetime.now().replace(month=1, day=1) + relativedelta(years=1),
+            (r'इस साल', lambda now: now.replace(month=1, day=1)),
+            (r'पिछले साल', lambda now: now.replace(month=1, day=1) - relativedelta(years=1)),
+            (r'अगले साल', lambda now: now.replace(month=1, day=1) + relativedelta(years=1)),
             
             # Time of day
-            r'सुबह': lambda: datetime.now().replace(hour=8, minute=0, second=0),
-            r'दोपहर': lambda: datetime.now().replace(hour=12, minute=0, second=0),
-            r'शाम': lambda: datetime.now().replace(hour=16, minute=0, second=0),
-            r'रात': lambda: datetime.now().replace(hour=20, minute=0, second=0)
-        }
+            (r'सुबह', lambda now: now.replace(hour=8, minute=0, second=0)),
+            (r'दोपहर', lambda now: now.replace(hour=12, minute=0, second=0)),
+            (r'शाम', lambda now: now.replace(hour=16, minute=0, second=0)),
+            (r'रात', lambda now: now.replace(hour=20, minute=0, second=0))
+        ]
+        self.relative_date_patterns = [(re.compile(p), fn) for p, fn in relative_dates]
 
         # Time range pattern: e.g., 15 से 20 जनवरी 2024, 1-5 मार्च 2023
-        self.range_patterns = [
-            r'(\d{1,2})\s*से\s*(\d{1,2})\s+(जनवरी|फरवरी|मार्च|अप्रैल|मई|जून|जुलाई|अगस्त|सितंबर|अक्टूबर|नवंबर|दिसंबर)\s+(\d{4})',
-            r'(\d{1,2})-(\d{1,2})\s+(जनवरी|फरवरी|मार्च|अप्रैल|मई|जून|जुलाई|अगस्त|सितंबर|अक्टूबर|नवंबर|दिसंबर)\s+(\d{4})'
-        ]
+        # The से form takes priority over the dash form
+        self.range_formats = [(kind, re.compile(p)) for kind, p in (
+            ('se', rf'(?P<se_start>\d{{1,2}})\s*से\s*(?P<se_end>\d{{1,2}})\s+(?P<se_month>{_MONTH_ALT})\s+(?P<se_year>\d{{4}})'),
+            ('dash', rf'(?P<dash_start>\d{{1,2}})-(?P<dash_end>\d{{1,2}})\s+(?P<dash_month>{_MONTH_ALT})\s+(?P<dash_year>\d{{4}})'),
+        )]
 
         # Recurring pattern: e.g., हर सोमवार, हर महीने की पहली तारीख
-        self.recurring_patterns = [
-            (r'हर\s+(सोमवार|मंगलवार|बुधवार|गुरुवार|शुक्रवार|शनिवार|रविवार)', 'weekly'),
+        self.recurring_patterns = [(re.compile(p), rec) for p, rec in (
+            (rf'हर\s+{_WEEKDAY_ALT}', 'weekly'),
             (r'हर\s+महीने\s+की\s+पहली\s+तारीख', 'monthly_first'),
             (r'हर\s+महीने\s+की\s+आखिरी\s+तारीख', 'monthly_last')
-        ]
+        )]
+
+    def _get_pipeline(self, need_deps: bool) -> stanza.Pipeline:
+        """Return the full or lite Stanza pipeline, loading it on first use."""
+        processors = _FULL_PROCESSORS if need_deps else _LITE_PROCESSORS
+        return _load_pipeline('hi', processors, self.device != "cpu", self.device)
+
+    @property
+    def nlp_full(self) -> stanza.Pipeline:
+        """Pipeline with dependency parsing."""
+        return self._get_pipeline(True)
+
+    @property
+    def nlp_lite(self) -> stanza.Pipeline:
+        """Pipeline without dependency parsing, for callers that only need dates."""
+        return self._get_pipeline(False)
+
+    @property
+    def nlp(self) -> stanza.Pipeline:
+        """The default pipeline, as chosen by need_deps."""
+        return self._get_pipeline(self.need_deps)
 
     def preprocess_text(self, text: str) -> str:
         """
@@ -105,107 +250,201 @@ class HindiTextProcessor:
             str: Preprocessed text
         """
         # Remove extra whitespace but preserve single spaces
-        text = re.sub(r'\s+', ' ', text)
+        text = _WS_RE.sub(' ', text)
         # Remove special characters except Hindi characters, numbers, and basic punctuation
-        text = re.sub(r'[^\u0900-\u097F\s.,!?:0-9]', '', text)
+        text = _NON_HINDI_RE.sub('', text)
         return text.strip()
 
-    def extract_time_range(self, text: str) -> Tuple[Optional[datetime], Optional[datetime], str]:
+    def _first_valid(self, formats: List[Tuple[str, re.Pattern]], text: str,
+                     decode: Callable[[str, re.Match], Any]) -> Tuple[Any, Optional[re.Match]]:
         """
-        Extract time range from text.
+        Search the formats in priority order and return the first match that
+        decodes without a ValueError.
         
         Args:
+            formats (List[Tuple[str, re.Pattern]]): Format names and patterns, in priority order
             text (str): Input text
+            decode (Callable[[str, re.Match], Any]): Turns a format name and its match into a value
             
         Returns:
-            Tuple[Optional[datetime], Optional[datetime], str]: Start date, end date, and remaining text
+            Tuple[Any, Optional[re.Match]]: Decoded value and its match, or (None, None)
         """
-        for pattern in self.range_patterns:
-            match = re.search(pattern, text)
+        for kind, pattern in formats:
+            match = pattern.search(text)
             if match:
-                start_day, end_day, month, year = match.groups()
-                month_num = self.hindi_months.get(month, '01')
                 try:
-                    start_date = datetime(int(year), int(month_num), int(start_day))
-                    end_date = datetime(int(year), int(month_num), int(end_day))
-                    remaining_text = text.replace(match.group(0), '').strip()
-                    return start_date, end_date, remaining_text
-                except Exception:
+                    return decode(kind, match), match
+                except ValueError:
                     continue
-        return None, None, text
+        return None, None
+
+    def extract_time_range(self, text: str) -> Tuple[Optional[datetime], Optional[datetime], str]:
+        """
+        Extract time range from text.
+        
+        Args:
+            text (str): Input text
+            
+        Returns:
+            Tuple[Optional[datetime], Optional[datetime], str]: Start date, end date, and remaining text
+        """
+        dates, match = self._first_valid(self.range_formats, text, self._decode_range)
+        if match is None:
+            return None, None, text
+        remaining_text = (text[:match.start()] + text[match.end():]).strip()
+        return dates[0], dates[1], remaining_text
+
+    def _decode_range(self, kind: str, match: re.Match) -> Tuple[datetime, datetime]:
+        """Build the start and end dates for a match of one of the range formats."""
+        year = int(match.group(f'{kind}_year'))
+        month = int(self.hindi_months.get(match.group(f'{kind}_month'), '01'))
+        return (datetime(year, month, int(match.group(f'{kind}_start'))),
+                datetime(year, month, int(match.group(f'{kind}_end'))))
 
     def extract_recurring(self, text: str) -> Tuple[Optional[str], str]:
         for pattern, recurrence in self.recurring_patterns:
-            match = re.search(pattern, text)
+            match = pattern.search(text)
             if match:
-                recurring_value = match.group(0)
-                remaining_text = text.replace(recurring_value, '').strip()
+                remaining_text = (text[:match.start()] + text[match.end():]).strip()
                 return recurrence, remaining_text
         return None, text
 
-    def extract_relative_date(self, text: str) -> Tuple[Optional[datetime], str]:
+    def _match_relative_date(self, text: str) -> Tuple[Optional[Callable[[datetime], datetime]], str]:
+        """
+        Find a relative date phrase in the text.
+        
+        Args:
+            text (str): Input text
+            
+        Returns:
+            Tuple: Function mapping the current time to the date, and the remaining text
+        """
+        for pattern, date_func in self.relative_date_patterns:
+            match = pattern.search(text)
+            if match:
+                remaining_text = (text[:match.start()] + text[match.end():]).strip()
+                return date_func, remaining_text
+        return None, text
+
+    def extract_relative_date(self, text: str, now: Optional[datetime] = None) -> Tuple[Optional[datetime], str]:
         """
         Extract relative date from text and return datetime object and remaining text.
         
         Args:
             text (str): Input text containing relative date
+            now (Optional[datetime]): Reference time, defaults to the current time
             
         Returns:
             Tuple[datetime, str]: Date object and text without date
         """
-        for pattern, date_func in self.relative_date_patterns.items():
-            match = re.search(pattern, text)
-            if match:
-                date_str = match.group(0)
-                try:
-                    date_obj = date_func()
-                    remaining_text = text.replace(date_str, '').strip()
-                    return date_obj, remaining_text
-                except Exception:
-                    continue
-        return None, text
+        date_func, remaining_text = self._match_relative_date(text)
+        if date_func is None:
+            return None, text
+        return date_func(now if now is not None else datetime.now()), remaining_text
+
+    def _decode_date(self, kind: str, match: re.Match) -> datetime:
+        """Build the date for a match of one of the date formats."""
+        if kind in ('dmy', 'dmy_short'):  # Day Month Year
+            month = self.hindi_months.get(match.group(f'{kind}_month'), '01')
+            return datetime(int(match.group(f'{kind}_year')), int(month), int(match.group(f'{kind}_day')))
+        if kind == 'numeric':  # Day/Month/Year
+            return datetime(int(match.group('num_year')), int(match.group('num_month')), int(match.group('num_day')))
+        if kind == 'year':  # Handle year-only format
+            return datetime(int(match.group('year_year')), 1, 1)
+        # Month Year
+        month = self.hindi_months.get(match.group('my_month'), '01')
+        return datetime(int(match.group('my_year')), int(month), 1)
 
-    def extract_date(self, text: str) -> Tuple[Optional[datetime], str]:
+    def _extract_absolute_date(self, text: str) -> Tuple[Optional[datetime], str]:
+        """
+        Extract a calendar date (not a relative one) from text.
+        
+        Args:
+            text (str): Input text
+            
+        Returns:
+            Tuple[Optional[datetime], str]: Date object and remaining text
+        """
+        date_obj, match = self._first_valid(self.date_formats, text, self._decode_date)
+        if match is None:
+            return None, text
+        # Remove the date from the text
+        remaining_text = (text[:match.start()] + text[match.end():]).strip()
+        return date_obj, remaining_text
+
+    def extract_date(self, text: str, now: Optional[datetime] = None) -> Tuple[Optional[datetime], str]:
         """
         Extract date from text.
         
         Args:
             text (str): Input text
+            now (Optional[datetime]): Reference time for relative dates, defaults to the current time
             
         Returns:
             Tuple[Optional[datetime], str]: Date object and remaining text
         """
         # First try relative dates
-        date_obj, remaining_text = self.extract_relative_date(text)
+        date_obj, remaining_text = self.extract_relative_date(text, now)
         if date_obj:
             return date_obj, remaining_text
 
         # Then try absolute dates
-        for pattern in self.date_patterns:
-            match = re.search(pattern, text)
-            if match:
-                try:
-                    if 'में' in pattern:  # Handle year-only format
-                        year = int(match.group(1))
-                        date_obj = datetime(year, 1, 1)
-                    elif len(match.groups()) == 3:  # Day Month Year
-                        day = int(match.group(1))
-                        month = self.hindi_months.get(match.group(2), '01')
-                        year = int(match.group(3))
-                        date_obj = datetime(year, int(month), day)
-                    elif len(match.groups()) == 2:  # Month Year
-                        month = self.hindi_months.get(match.group(1), '01')
-                        year = int(match.group(2))
-                        date_obj = datetime(year, int(month), 1)
-                    else:  # Day of week
-                        continue  # Skip day of week as it's not a specific date
-                    
-                    # Remove the date from the text
-                    remaining_text = text.replace(match.group(0), '').strip()
-                    return date_obj, remaining_text
-                except (ValueError, IndexError):
-                    continue
-        return None, text
+        return self._extract_absolute_date(text)
+
+    def _scan_anchors(self, text: str) -> Set[str]:
+        """Return the anchor categories present anywhere in the text."""
+        if _ANCHOR_DATABASE is None:
+            # A re scan for the anchors costs about as much as running the
+            # extractors it would skip, so without Hyperscan all of them run
+            return _ALL_ANCHORS
+        
+        found = set()
+        def on_match(anchor_id, start, end, flags, context):
+            found.add(_ANCHOR_CATEGORIES[anchor_id])
+        _ANCHOR_DATABASE.scan(text.encode('utf-8'), match_event_handler=on_match, scratch=_anchor_scratch())
+        return found
+
+    def _match_all(self, text: str) -> Tuple[Optional[datetime], Optional[datetime], Optional[datetime], Optional[Callable[[datetime], datetime]], Optional[str], str]:
+        """
+        Run the range, recurring and date extractors on a single point. This
+        depends only on the text, so results are memoized per point in __init__;
+        relative dates are returned unresolved as their date function.
+        
+        Args:
+            text (str): A single point
+            
+        Returns:
+            Tuple: Start date, end date, date, relative date function, recurrence, and remaining text
+        """
+        anchors = self._scan_anchors(text)
+        start_date = end_date = date_obj = date_func = recurrence = None
+        # Ranges always name a month
+        if 'month' in anchors:
+            start_date, end_date, text = self.extract_time_range(text)
+        if 'recurring' in anchors:
+            recurrence, text = self.extract_recurring(text)
+        # If not a range, check for single date, relative dates first
+        if not start_date and not end_date and not anchors.isdisjoint(_DATE_ANCHORS):
+            date_func, text = self._match_relative_date(text)
+            if date_func is None:
+                date_obj, text = self._extract_absolute_date(text)
+        return start_date, end_date, date_obj, date_func, recurrence, text
+
+    def _extract_all(self, text: str, now: Optional[datetime] = None) -> Tuple[Optional[datetime], Optional[datetime], Optional[datetime], Optional[str], str]:
+        """
+        Extract the time range, recurrence and single date of a point.
+        
+        Args:
+            text (str): A single point
+            now (Optional[datetime]): Reference time for relative dates
+            
+        Returns:
+            Tuple: Start date, end date, date, recurrence, and remaining text
+        """
+        start_date, end_date, date_obj, date_func, recurrence, text = self._match_all(text)
+        if date_func is not None:
+            date_obj = date_func(now if now is not None else datetime.now())
+        return start_date, end_date, date_obj, recurrence, text
 
     def split_into_points(self, text: str) -> List[str]:
         """
@@ -217,23 +456,90 @@ class HindiTextProcessor:
         Returns:
             List[str]: List of individual points
         """
-        # Split by newlines and periods
-        points = []
-        for line in text.split('\n'):
-            line = line.strip()
-            if not line:
+        # Split by newlines and periods in one pass, keeping the period
+        return [point for piece in _POINT_SPLIT_RE.split(text) if (point := piece.strip())]
+
+    def tokenize(self, text: str, need_deps: Optional[bool] = None) -> List[Dict[str, Any]]:
+        """
+        Run the Stanza pipeline on a text and return its tokens.
+        
+        Args:
+            text (str): Text left over after date extraction
+            need_deps (Optional[bool]): Override the processor's need_deps setting
+            
+        Returns:
+            List[Dict[str, Any]]: Tokens with their linguistic features
+        """
+        return self.tokenize_many([text], need_deps)[0]
+
+    def tokenize_many(self, texts: List[str], need_deps: Optional[bool] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Run the Stanza pipeline on several texts in one batch. Results are
+        cached per text, so repeated statements skip the pipeline entirely.
+        Texts without any Hindi letters (empty, or only digits and punctuation)
+        are never sent to it and get no tokens.
+        
+        Without dependency parsing the "head" and "deprel" of each token are None.
+        
+        Args:
+            texts (List[str]): Texts left over after date extraction
+            need_deps (Optional[bool]): Override the processor's need_deps setting
+            
+        Returns:
+            List[List[Dict[str, Any]]]: Tokens for each text, in input order
+        """
+        if need_deps is None:
+            need_deps = self.need_deps
+        token_cache = self._token_caches[need_deps]
+        texts = [text.strip() for text in texts]
+        texts = [text if _DEVANAGARI_LETTER_RE.search(text) else '' for text in texts]
+        
+        # Look up each distinct text once; only unseen texts go to the pipeline
+        found = {}
+        pending = []
+        for text in dict.fromkeys(texts):
+            if not text:
                 continue
-            # Split by periods but keep the period
-            sentences = re.split(r'(?<=।)', line)
-            points.extend([s.strip() for s in sentences if s.strip()])
-        return points
+            tokens = token_cache.get(text)
+            if tokens is None:
+                pending.append(text)
+            else:
+                token_cache.move_to_end(text)
+                found[text] = tokens
+        
+        # Unseen texts go to Stanza in fixed-size batches, so a long document
+        # never holds every Stanza Document in memory at once
+        for offset in range(0, len(pending), _BULK_BATCH_SIZE):
+            batch = pending[offset:offset + _BULK_BATCH_SIZE]
+            docs = self._get_pipeline(need_deps).bulk_process(batch)
+            for text, doc in zip(batch, docs):
+                tokens = tuple([
+                    {
+                        "id": word.id,
+                        "text": word.text,
+                        "lemma": word.lemma,
+                        "upos": word.upos,
+                        "head": word.head if need_deps else None,
+                        "deprel": word.deprel if need_deps else None,
+                    }
+                    for sentence in doc.sentences
+                    for word in sentence.words
+                ])
+                found[text] = tokens
+                token_cache[text] = tokens
+                if len(token_cache) > _TOKEN_CACHE_SIZE:
+                    token_cache.popitem(last=False)
+        
+        # Hand out copies so callers cannot modify the cached tokens
+        return [[token.copy() for token in found[text]] if text else [] for text in texts]
 
-    def process_text(self, text: str) -> List[Dict[str, Any]]:
+    def process_text(self, text: str, need_deps: Optional[bool] = None) -> List[Dict[str, Any]]:
         """
         Process Hindi text and return structured analysis with chronological ordering.
         
         Args:
             text (str): Input Hindi text
+            need_deps (Optional[bool]): Override the processor's need_deps setting
             
         Returns:
             List[Dict[str, Any]]: List of tokens with their linguistic features
@@ -244,21 +550,13 @@ class HindiTextProcessor:
         # Split into points
         points = self.split_into_points(cleaned_text)
         
-        # Process each point
+        # Extract dates from every point first, relative to a single reference time
+        now = datetime.now()
         result = []
+        residuals = []
         for point in points:
-            # Check for time range
-            start_date, end_date, temp_text = self.extract_time_range(point)
-            # Check for recurring
-            recurrence, temp_text = self.extract_recurring(temp_text)
-            # If not a range, check for single date
-            if not start_date and not end_date:
-                date_obj, temp_text = self.extract_date(temp_text)
-            else:
-                date_obj = None
-            
-            # Process with Stanza
-            doc = self.nlp(temp_text)
+            # Extract time range, recurrence and single date
+            start_date, end_date, date_obj, recurrence, temp_text = self._extract_all(point, now)
             
             # Structure the output
             point_info = {
@@ -269,58 +567,43 @@ class HindiTextProcessor:
                 "recurrence": recurrence,
                 "tokens": []
             }
-            
-            # Process each sentence in the document
-            for sentence in doc.sentences:
-                for word in sentence.words:
-                    token_info = {
-                        "id": word.id,
-                        "text": word.text,
-                        "lemma": word.lemma,
-                        "upos": word.upos,
-                        "head": word.head,
-                        "deprel": word.deprel,
-                    }
-                    point_info["tokens"].append(token_info)
-            
             result.append(point_info)
+            residuals.append(temp_text)
+        
+        # Then run Stanza once over all the remaining text
+        for point_info, tokens in zip(result, self.tokenize_many(residuals, need_deps)):
+            point_info["tokens"] = tokens
         
         return result
 
-    def process_text_to_json(self, text: str) -> str:
+    def process_text_to_json(self, text: str, need_deps: Optional[bool] = None) -> str:
         """
         Process Hindi text and return JSON string.
         
         Args:
             text (str): Input Hindi text
+            need_deps (Optional[bool]): Override the processor's need_deps setting
             
         Returns:
             str: JSON string containing the analysis
         """
-        result = self.process_text(text)
+        result = self.process_text(text, need_deps)
         # Sort statements chronologically
         sorted_result = sort_statements_chronologically(result)
-        return json.dumps(sorted_result, ensure_ascii=False, indent=2)
+        return _dumps(sorted_result)
+
+# Sort key for recurring events and statements without any date information
+_UNDATED_SORT_KEY = '9999-12-31T00:00:00'
+
+def _statement_sort_key(statement):
+    # Date ranges sort by their end, then single dates, then start dates.
+    # ISO-8601 strings compare in chronological order.
+    return (statement.get('end_date') or statement.get('date')
+            or statement.get('start_date') or _UNDATED_SORT_KEY)
 
 def sort_statements_chronologically(statements):
     # Sort statements based on their date or recurrence
-    def get_sort_key(statement):
-        # First check for date ranges
-        if statement.get('end_date'):
-            return statement['end_date']
-        # Then check for single dates
-        elif statement.get('date'):
-            return statement['date']
-        # Then check for start dates
-        elif statement.get('start_date'):
-            return statement['start_date']
-        # For recurring events, use a default date for sorting
-        elif statement.get('recurrence'):
-            return '9999-12-31T00:00:00'
-        # Default for statements without any date information
-        return '9999-12-31T00:00:00'
-
-    return sorted(statements, key=get_sort_key)
+    return sorted(statements, key=_statement_sort_key)
 
 def main():
     """Example usage of the HindiTextProcessor."""
@@ -352,7 +635,7 @@ def main():
     sorted_statements = sort_statements_chronologically(statements)
     
     # Print the sorted statements
-    print(json.dumps(sorted_statements, indent=2, ensure_ascii=False))
+    print(_dumps(sorted_statements))
 
 if __name__ == "__main__":
     main() 
@@ -0,0 +1,219 @@
+"""
+Tests for HindiTextProcessor. Expected values are those of the original
+implementation, except for numeric dates, whose month it ignored. Stanza is
+replaced by a stub so no models are needed.
+"""
+import threading
+from datetime import datetime
+
+import pytest
+
+import kaalkram
+from kaalkram import HindiTextProcessor
+
+NOW = datetime(2026, 10, 15, 10, 30, 5)
+
+
+class _Word:
+    def __init__(self, index: int, text: str):
+        self.id = index
+        self.text = text
+        self.lemma = text
+        self.upos = 'X'
+        self.head = 0
+        self.deprel = 'dep'
+
+
+class _Sentence:
+    def __init__(self, text: str):
+        self.words = [_Word(index + 1, word) for index, word in enumerate(text.split())]
+
+
+class _Document:
+    def __init__(self, text: str):
+        self.sentences = [_Sentence(text)]
+
+
+class FakePipeline:
+    """Splits on whitespace and records every batch it is given."""
+
+    def __init__(self, *args, **kwargs):
+        self.batches = []
+
+    def bulk_process(self, texts):
+        self.batches.append(list(texts))
+        return [_Document(text) for text in texts]
+
+
+@pytest.fixture
+def processor(monkeypatch):
+    monkeypatch.setattr(kaalkram.stanza, 'Pipeline', FakePipeline)
+    kaalkram._load_pipeline.cache_clear()
+    yield HindiTextProcessor(device='cpu')
+    kaalkram._load_pipeline.cache_clear()
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('15 से 20 जनवरी 2024 को मेला', (datetime(2024, 1, 15), datetime(2024, 1, 20), 'को मेला')),
+    ('1-5 मार्च 2023 को परीक्षा', (datetime(2023, 3, 1), datetime(2023, 3, 5), 'को परीक्षा')),
+    # The से form wins over an earlier dash form
+    ('1-2 मार्च 2023 और 5 से 7 जनवरी 2024', (datetime(2024, 1, 5), datetime(2024, 1, 7), '1-2 मार्च 2023 और')),
+    # Only the first range of each form is tried
+    ('31 से 32 जनवरी 2024 और 2 से 3 जनवरी 2024', (None, None, '31 से 32 जनवरी 2024 और 2 से 3 जनवरी 2024')),
+    ('31 से 32 जनवरी 2024 और 2-3 जनवरी 2024', (datetime(2024, 1, 2), datetime(2024, 1, 3), '31 से 32 जनवरी 2024 और')),
+])
+def test_extract_time_range(processor, text, expected):
+    assert processor.extract_time_range(text) == expected
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('हर सोमवार को योग कक्षा', ('weekly', 'को योग कक्षा')),
+    ('हर महीने की पहली तारीख को वेतन', ('monthly_first', 'को वेतन')),
+    ('हर महीने की आखिरी तारीख को बैठक', ('monthly_last', 'को बैठक')),
+    ('हर साल दिवाली', (None, 'हर साल दिवाली')),
+])
+def test_extract_recurring(processor, text, expected):
+    assert processor.extract_recurring(text) == expected
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('कल सुबह बैठक', (datetime(2026, 10, 14, 10, 30, 5), 'सुबह बैठक')),
+    ('आज विपक्ष', (datetime(2026, 10, 15, 10, 30, 5), 'विपक्ष')),
+    ('परसों', (datetime(2026, 10, 13, 10, 30, 5), '')),
+    ('पिछले हफ्ते नीति', (datetime(2026, 10, 5, 10, 30, 5), 'नीति')),
+    ('अगले हफ्ते बैठक', (datetime(2026, 10, 19, 10, 30, 5), 'बैठक')),
+    ('इस महीने', (datetime(2026, 10, 1, 10, 30, 5), '')),
+    ('पिछले साल', (datetime(2025, 1, 1, 10, 30, 5), '')),
+    ('रात को', (datetime(2026, 10, 15, 20, 0), 'को')),
+])
+def test_extract_relative_date(processor, text, expected):
+    assert processor.extract_relative_date(text, now=NOW) == expected
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('5 दिस 2022 को', (datetime(2022, 12, 5), 'को')),
+    ('2023 में योजना', (datetime(2023, 1, 1), 'योजना')),
+    # Unlike the original, which always read January, numeric dates keep their
+    # month and an invalid month is not a date
+    ('12/05/2021 को बैठक', (datetime(2021, 5, 12), 'को बैठक')),
+    ('13/25/2024 को', (None, '13/25/2024 को')),
+    # An invalid day falls through to the month-year format
+    ('31 फरवरी 2024', (datetime(2024, 2, 1), '31')),
+    # ...or to a valid date of a later format elsewhere in the text
+    ('31 फरवरी 2024 को मेला, 10 मार्च 2024 को समापन।',
+     (datetime(2024, 3, 10), '31 फरवरी 2024 को मेला,  को समापन।')),
+])
+def test_extract_date(processor, text, expected):
+    assert processor.extract_date(text, now=NOW) == expected
+
+
+def test_process_text_skips_invalid_date(processor):
+    result = processor.process_text('31 फरवरी 2024 को मेला, 10 मार्च 2024 को समापन।')
+    assert [point['date'] for point in result] == ['2024-03-10T00:00:00']
+
+
+def test_memoized_relative_date_follows_now(processor):
+    first = processor._extract_all('आज बैठक हुई', now=NOW)
+    second = processor._extract_all('आज बैठक हुई', now=datetime(2027, 1, 2, 9, 0))
+    assert first == (None, None, NOW, None, 'बैठक हुई')
+    assert second == (None, None, datetime(2027, 1, 2, 9, 0), None, 'बैठक हुई')
+    assert processor._match_all.cache_info().hits == 1
+
+
+def test_process_text_resolves_cached_relative_date_per_call(processor, monkeypatch):
+    class FixedDatetime(datetime):
+        current = NOW
+
+        @classmethod
+        def now(cls, tz=None):
+            return cls.current
+
+    monkeypatch.setattr(kaalkram, 'datetime', FixedDatetime)
+    first = processor.process_text('कल बैठक हुई।')
+    FixedDatetime.current = datetime(2027, 1, 2, 9, 0)
+    second = processor.process_text('कल बैठक हुई।')
+    assert first[0]['date'] == '2026-10-14T10:30:05'
+    assert second[0]['date'] == '2027-01-01T09:00:00'
+
+
+def test_repeated_points_hit_the_extraction_cache(processor):
+    result = processor.process_text('15 जनवरी 2024 को मेला।\n15 जनवरी 2024 को मेला।\nहर सोमवार को योग।')
+    assert [point['date'] for point in result] == ['2024-01-15T00:00:00', '2024-01-15T00:00:00', None]
+    info = processor._match_all.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+
+def test_tokenize_many_order_and_duplicates(processor):
+    tokens = processor.tokenize_many(['दूसरा वाक्य', ' पहला ', '', '12 ,', 'दूसरा वाक्य'])
+    assert [[token['text'] for token in text_tokens] for text_tokens in tokens] == [
+        ['दूसरा', 'वाक्य'], ['पहला'], [], [], ['दूसरा', 'वाक्य'],
+    ]
+    # Each distinct Hindi text is analysed once; the rest never reach Stanza
+    assert processor.nlp_full.batches == [['दूसरा वाक्य', 'पहला']]
+
+
+def test_tokenize_many_returns_copies_of_cached_tokens(processor):
+    first = processor.tokenize('पहला वाक्य')
+    first[0]['text'] = 'बदला'
+    second = processor.tokenize('पहला वाक्य')
+    assert [token['text'] for token in second] == ['पहला', 'वाक्य']
+    assert len(processor.nlp_full.batches) == 1
+
+
+def test_tokenize_many_without_deps(processor):
+    tokens = processor.tokenize('पहला वाक्य', need_deps=False)
+    assert {(token['head'], token['deprel']) for token in tokens} == {(None, None)}
+    assert processor.nlp_full is not processor.nlp_lite
+
+
+def test_tokenize_many_batches(processor, monkeypatch):
+    monkeypatch.setattr(kaalkram, '_BULK_BATCH_SIZE', 2)
+    texts = ['एक', 'दो', 'तीन', 'दो', 'चार', 'पांच']
+    tokens = processor.tokenize_many(texts)
+    assert [text_tokens[0]['text'] for text_tokens in tokens] == texts
+    assert processor.nlp_full.batches == [['एक', 'दो'], ['तीन', 'चार'], ['पांच']]
+
+
+@pytest.mark.skipif(kaalkram._ANCHOR_DATABASE is None, reason='needs Hyperscan')
+@pytest.mark.parametrize('text', [
+    '15 से 20 जनवरी 2024 को मेला', 'हर सोमवार को योग कक्षा', 'कल सुबह 12/05/2021 को',
+    '2023 में योजना', 'योजना में बदलाव', 'मार्च 2020 की बैठक', '१५ जनवरी २०२४ को मेला',
+])
+def test_anchor_gate_does_not_change_results(processor, monkeypatch, text):
+    gated = processor._match_all.__wrapped__(text)
+    monkeypatch.setattr(kaalkram, '_ANCHOR_DATABASE', None)
+    assert processor._match_all.__wrapped__(text) == gated
+
+
+@pytest.mark.skipif(kaalkram._ANCHOR_DATABASE is None, reason='needs Hyperscan')
+def test_scan_anchors_from_several_threads(processor):
+    texts = ['15 से 20 जनवरी 2024 को मेला', 'हर सोमवार को योग कक्षा', 'कल सुबह 12/05/2021 को', '2023 में योजना', 'योजना में बदलाव']
+    expected = [{'month'}, {'recurring'}, {'relative', 'numeric'}, {'year'}, set()]
+    barrier = threading.Barrier(8)
+    results = []
+    errors = []
+
+    def scan():
+        barrier.wait()
+        try:
+            for _ in range(500):
+                results.append([processor._scan_anchors(text) for text in texts])
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=scan) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert all(result == expected for result in results)
+
+
+@pytest.mark.skipif(kaalkram.hyperscan is None, reason='needs Hyperscan')
+@pytest.mark.parametrize('failing', ['Database', 'Scratch'])
+def test_anchor_database_falls_back_when_hyperscan_fails(monkeypatch, failing):
+    def fail(*args, **kwargs):
+        raise kaalkram.hyperscan.ArchitectureError('unsupported CPU')
+    monkeypatch.setattr(kaalkram.hyperscan, failing, fail)
+    assert kaalkram._compile_anchor_database() is None